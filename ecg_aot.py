@@ -0,0 +1,33 @@
+# AOT build script for the hot ECG classification kernels
+# Run `python ecg_aot.py` once to produce the ecg_kernels extension module;
+# advanced_ecg_warning_demo.py then loads precompiled machine code instead of
+# paying LLVM JIT warmup on the first classification call.
+
+from numba.pycc import CC
+
+cc = CC('ecg_kernels')
+
+@cc.export('hr_code', 'i8(f8)')
+def hr_code(hr):
+    """Classify a heart rate into a numeric alert code"""
+    if hr < 40:
+        return 3
+    elif hr > 150:
+        return 4
+    elif hr < 60:
+        return 1
+    elif hr > 100:
+        return 2
+    else:
+        return 0
+
+@cc.export('classify_hr_batch', 'void(f8[:], i1[:])')
+def classify_hr_batch(hr, out):
+    """Classify a whole array of heart rates into alert codes"""
+    for i in range(hr.shape[0]):
+        h = hr[i]
+        out[i] = 3 if h < 40 else 4 if h > 150 else 1 if h < 60 else 2 if h > 100 else 0
+
+if __name__ == '__main__':
+    cc.compile()
+    print('✅ ecg_kernels extension built')